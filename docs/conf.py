@@ -133,9 +133,16 @@ source_suffix = {
 # Notebook execution settings (used by myst_nb).
 nb_output_stderr = "remove"
 nb_execution_mode = "cache"
+# Escape hatch for prose-only iteration: skip notebook execution entirely.
+if os.environ.get("SKIP_NOTEBOOKS"):
+    nb_execution_mode = "off"
+# Keep the jupyter-cache outside _build so cleaning the HTML output does
+# not force notebooks to re-execute.
+nb_execution_cache_path = str(Path(__file__).parent / "_jupyter-cache")
 nb_execution_timeout = 300
 nb_merge_streams = True
 execution_excludepatterns = [
+    "_jupyter-cache/**",  # never re-stage the cache's own notebooks
     "**/*grb*.ipynb",  # grb indicates that uses Gurobi
     "**/kpnn-with-sc.ipynb",  # very slow, requires jax, keras
     "tutorials/**/*.ipynb",  # tutorials are independent and slow, use cached versions
@@ -159,6 +166,7 @@ templates_path = ["_templates"]
 # Patterns to ignore when looking for source files.
 exclude_patterns = [
     "_build",
+    "_jupyter-cache",  # executed notebooks stored by myst-nb, not documents
     "Thumbs.db",
     ".DS_Store",
     "**.ipynb_checkpoints",
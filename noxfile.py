@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 
+import hashlib
 import os
 import shutil
 from pathlib import Path
@@ -14,14 +15,20 @@ import nox
 
 nox.options.reuse_existing_virtualenvs = True
 nox.options.error_on_missing_interpreters = False
+# Default invocation runs a minimal set; the full matrix stays reachable
+# via `nox -s <session>`.
+nox.options.sessions = ["tests", "typing"]
 
 PYTHON_VERSIONS: tuple[str, ...] = ("3.10", "3.11", "3.12")
+# Single interpreter for version-independent sessions (lint, format, docs).
+MAIN_PYTHON = "3.11"
 
 # Paths -----------------------------------------------------------------------
 
 PROJECT_ROOT = Path(__file__).parent
 DOCS_SRC = PROJECT_ROOT / "docs"
 DOCS_HTML = DOCS_SRC / "_build" / "html"
+DOCS_DOCTREES = DOCS_SRC / "_build" / "doctrees"
 DOCS_LINKCHECK = DOCS_SRC / "_build" / "linkcheck"
 JUPYTER_CACHE = DOCS_SRC / "_jupyter-cache"
 
@@ -34,9 +41,30 @@ TUTORIALS_ROOT = DOCS_SRC / "tutorials"
 
 
 def _install(session: nox.Session, extras: str | Iterable[str] = "") -> None:
+    """Editable-install the project, skipping the install when nothing changed.
+
+    A stamp file inside the session's virtualenv records a hash of
+    ``pyproject.toml`` plus the requested extras; when it matches, the
+    (slow) ``pip install -e`` is skipped entirely. Combine with ``nox -R``
+    to also reuse the virtualenv itself across invocations.
+    """
     extras_str = extras if isinstance(extras, str) else ",".join(extras)
     target = f".[{extras_str}]" if extras_str else "."
+
+    venv_dir = getattr(session.virtualenv, "location", None)
+    stamp: Path | None = None
+    if venv_dir:
+        digest = hashlib.sha256()
+        digest.update((PROJECT_ROOT / "pyproject.toml").read_bytes())
+        digest.update(extras_str.encode())
+        stamp = Path(venv_dir) / ".install-stamp"
+        if stamp.exists() and stamp.read_text() == digest.hexdigest():
+            session.log(f"Skipping install of {target} (unchanged)")
+            return
+
     session.install("-e", target)
+    if stamp is not None:
+        stamp.write_text(digest.hexdigest())
 
 
 # -----------------------------------------------------------------------------
@@ -46,19 +74,43 @@ def _install(session: nox.Session, extras: str | Iterable[str] = "") -> None:
 
 @nox.session(python=PYTHON_VERSIONS)
 def tests(session: nox.Session) -> None:
-    """Run pytest across supported interpreters."""
+    """Run pytest across supported interpreters (parallel; pass ``-n0`` for serial)."""
     _install(session, extras=["dev", "docs"])
-    session.run("pytest", "tests", *session.posargs)
+    session.run("pytest", "tests", "-n", "auto", "--dist=loadfile", *session.posargs)
 
 
-@nox.session(python=PYTHON_VERSIONS)
+@nox.session(python=False)
+def tests_parallel(session: nox.Session) -> None:
+    """Run the ``tests`` session for every interpreter concurrently."""
+    import concurrent.futures
+    import subprocess
+
+    cmds = [["nox", "-s", f"tests-{version}", "--", *session.posargs] for version in PYTHON_VERSIONS]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(cmds)) as executor:
+        results = list(executor.map(lambda cmd: subprocess.run(cmd, capture_output=True), cmds))
+
+    failed = []
+    for cmd, result in zip(cmds, results):
+        session.log(f"$ {' '.join(cmd)}")
+        if result.stdout:
+            session.log(result.stdout.decode(errors="replace"))
+        if result.returncode != 0:
+            if result.stderr:
+                session.log(result.stderr.decode(errors="replace"))
+            failed.append(cmd[2])
+
+    if failed:
+        session.error(f"Sessions failed: {', '.join(failed)}")
+
+
+@nox.session(python=MAIN_PYTHON)
 def lint(session: nox.Session) -> None:
     """Static analysis with Ruff (no auto‑fix)."""
     _install(session, extras=["dev"])
     session.run("ruff", "check", "corneto", "--exclude", "tests", *session.posargs)
 
 
-@nox.session(python=PYTHON_VERSIONS)
+@nox.session(python=MAIN_PYTHON)
 def format(session: nox.Session) -> None:
     """Apply Ruff auto‑fixes and re‑format code."""
     _install(session, extras=["dev"])
@@ -80,63 +132,84 @@ def typing(session: nox.Session) -> None:
 
 def _sphinx(session: nox.Session, *opts: str) -> None:
     os.makedirs(JUPYTER_CACHE, exist_ok=True)
-    session.run("sphinx-build", "-b", "html", *opts, str(DOCS_SRC), str(DOCS_HTML))
+    session.run("sphinx-build", "-b", "html", "-j", "auto", *opts, str(DOCS_SRC), str(DOCS_HTML))
 
 
-@nox.session(python=PYTHON_VERSIONS)
+def _clean_build() -> None:
+    """Remove the HTML output and doctrees, preserving the jupyter-cache."""
+    for path in (DOCS_HTML, DOCS_DOCTREES):
+        if path.exists():
+            shutil.rmtree(path)
+
+
+@nox.session(python=MAIN_PYTHON)
 def docs(session: nox.Session) -> None:
     """Build HTML docs with myst‑nb cache (default)."""
     _install(session, extras=["docs"])
     _sphinx(session)
 
 
-@nox.session(python=PYTHON_VERSIONS)
+@nox.session(python=MAIN_PYTHON)
+def docs_fast(session: nox.Session) -> None:
+    """Build HTML docs without executing notebooks (prose-only iteration)."""
+    _install(session, extras=["docs"])
+    session.env["SKIP_NOTEBOOKS"] = "1"
+    _sphinx(session)
+
+
+@nox.session(python=MAIN_PYTHON)
 def docs_force(session: nox.Session) -> None:
     """Force notebook execution, then build HTML docs."""
     _install(session, extras=["docs"])
     _sphinx(session, "-D", "nb_execution_mode=force")
 
 
-@nox.session(python=PYTHON_VERSIONS)
+@nox.session(python=MAIN_PYTHON)
 def docs_clean(session: nox.Session) -> None:
-    """Remove previous build and rebuild HTML docs."""
+    """Remove previous build and rebuild HTML docs (keeps notebook cache)."""
     _install(session, extras=["docs"])
-    if DOCS_HTML.exists():
-        shutil.rmtree(DOCS_HTML)
+    _clean_build()
     _sphinx(session)
 
 
-@nox.session(python=PYTHON_VERSIONS)
+@nox.session(python=MAIN_PYTHON)
+def docs_clean_cache(session: nox.Session) -> None:
+    """Wipe the jupyter-cache so the next build re-executes all notebooks."""
+    if JUPYTER_CACHE.exists():
+        shutil.rmtree(JUPYTER_CACHE)
+        session.log(f"Removed {JUPYTER_CACHE}")
+
+
+@nox.session(python=MAIN_PYTHON)
 def docs_werror(session: nox.Session) -> None:
     """Build docs but fail on warnings."""
     _install(session, extras=["docs"])
-    _sphinx(session, "-W")
+    _sphinx(session, "-W", "--keep-going")
 
 
-@nox.session(python=PYTHON_VERSIONS)
+@nox.session(python=MAIN_PYTHON)
 def docs_all(session: nox.Session) -> None:
     """Clean, force notebook execution, and build docs with warnings as errors."""
     _install(session, extras=["docs"])
-    if DOCS_HTML.exists():
-        shutil.rmtree(DOCS_HTML)
-    _sphinx(session, "-D", "nb_execution_mode=force", "-W")
+    _clean_build()
+    _sphinx(session, "-D", "nb_execution_mode=force", "-W", "--keep-going")
 
 
-@nox.session(python=PYTHON_VERSIONS)
+@nox.session(python=MAIN_PYTHON)
 def docs_linkcheck(session: nox.Session) -> None:
     """Verify outbound links."""
     _install(session, extras=["docs"])
     session.run("sphinx-build", "-b", "linkcheck", str(DOCS_SRC), str(DOCS_LINKCHECK))
 
 
-@nox.session(python=PYTHON_VERSIONS)
+@nox.session(python=MAIN_PYTHON)
 def docs_full(session: nox.Session) -> None:
     """Full local docs check: build documentation."""
     _install(session, extras=["docs"])
     _sphinx(session)
 
 
-@nox.session(python=PYTHON_VERSIONS)
+@nox.session(python=MAIN_PYTHON)
 def docs_serve(session: nox.Session) -> None:
     """Serve HTML docs at http://localhost:8000."""
     _install(session, extras=["docs"])
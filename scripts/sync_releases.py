@@ -5,35 +5,127 @@ This script fetches releases from the GitHub API and generates corresponding
 Markdown files in the docs/releases/ directory for Sphinx documentation.
 """
 
+import gzip
 import json
 import os
 import re
 from datetime import datetime
+from http.client import HTTPSConnection
 from pathlib import Path
 from typing import Dict, List, Optional
-from urllib.error import HTTPError
-from urllib.request import Request, urlopen
 
+# Patterns used by clean_release_body, compiled once at import time.
+_HTML_COMMENT = re.compile(r"<!--.*?-->", re.DOTALL)
+_REL_LINK = re.compile(r"\[([^\]]+)\]\((\.\./|/)([^)]+)\)")
 
-def get_github_releases(repo: str, token: Optional[str] = None) -> List[Dict]:
-    """Fetch releases from GitHub API."""
-    url = f"https://api.github.com/repos/{repo}/releases"
 
+def _is_markdown_header(line: str) -> bool:
+    """Return True for lines of the form ``#{1,6}`` followed by whitespace."""
+    hashes = len(line) - len(line.lstrip("#"))
+    return 1 <= hashes <= 6 and line[hashes : hashes + 1].isspace()
+
+
+def _write_if_changed(path: Path, content: str) -> bool:
+    """Write content to path only if it differs from what is on disk.
+
+    Skipping identical writes keeps file mtimes stable so Sphinx can reuse
+    its incremental doctree cache on subsequent builds.
+
+    Returns:
+        True if the file was written, False if it was already up to date.
+    """
+    if path.exists() and path.read_text(encoding="utf-8") == content:
+        return False
+    path.write_text(content, encoding="utf-8")
+    return True
+
+
+def _releases_cache_file(repo: str) -> Path:
+    """Return the cache file path for a repository's releases payload."""
+    return Path(".cache") / f"github-releases-{repo.replace('/', '-')}.json"
+
+
+def _load_releases_cache(repo: str) -> Dict:
+    """Load the cached ETag and releases list, or an empty dict if absent."""
+    cache_file = _releases_cache_file(repo)
+    if cache_file.exists():
+        try:
+            return json.loads(cache_file.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError):
+            pass
+    return {}
+
+
+def _save_releases_cache(repo: str, etag: Optional[str], releases: List[Dict]) -> None:
+    """Persist the ETag and releases list for conditional requests."""
+    cache_file = _releases_cache_file(repo)
+    cache_file.parent.mkdir(exist_ok=True)
+    cache_file.write_text(json.dumps({"etag": etag, "releases": releases}), encoding="utf-8")
+
+
+def get_github_releases(repo: str, token: Optional[str] = None, max_pages: int = 10) -> List[Dict]:
+    """Fetch releases from GitHub API.
+
+    Uses a conditional request (``If-None-Match``) against a local cache so
+    that re-syncs without new releases cost a single 304 response, and
+    paginates with ``per_page=100`` up to ``max_pages`` pages. A single
+    HTTPS connection is reused across pages and responses are requested
+    gzip-compressed, so the TLS handshake is paid once and the transferred
+    JSON is a fraction of its raw size.
+    """
     headers = {
         "Accept": "application/vnd.github.v3+json",
+        "Accept-Encoding": "gzip",
         "User-Agent": "corneto-sync-releases/1.0",
     }
 
     if token:
         headers["Authorization"] = f"Bearer {token}"
 
+    cache = _load_releases_cache(repo)
+
+    releases: List[Dict] = []
+    etag: Optional[str] = None
+    connection = HTTPSConnection("api.github.com", timeout=10)
     try:
-        request = Request(url, headers=headers)
-        with urlopen(request) as response:
-            return json.loads(response.read().decode())
-    except HTTPError as e:
+        for page in range(1, max_pages + 1):
+            page_headers = dict(headers)
+            if page == 1 and cache.get("etag"):
+                page_headers["If-None-Match"] = cache["etag"]
+
+            connection.request("GET", f"/repos/{repo}/releases?per_page=100&page={page}", headers=page_headers)
+            response = connection.getresponse()
+
+            if response.status == 304:
+                response.read()  # drain so the connection stays reusable
+                print(f"Releases unchanged for {repo} (cache hit)")
+                return cache.get("releases", [])
+            if response.status != 200:
+                response.read()
+                print(f"Error fetching releases: HTTP {response.status} {response.reason}")
+                return []
+
+            if page == 1:
+                etag = response.getheader("ETag")
+
+            # Parse straight from the (decompressing) stream; avoids
+            # buffering the whole body as bytes plus a decoded str copy.
+            if response.getheader("Content-Encoding") == "gzip":
+                page_releases = json.load(gzip.GzipFile(fileobj=response))
+            else:
+                page_releases = json.load(response)
+
+            releases.extend(page_releases)
+            if len(page_releases) < 100:
+                break
+    except OSError as e:
         print(f"Error fetching releases: {e}")
         return []
+    finally:
+        connection.close()
+
+    _save_releases_cache(repo, etag, releases)
+    return releases
 
 
 def clean_release_body(body: str) -> str:
@@ -42,35 +134,37 @@ def clean_release_body(body: str) -> str:
         return ""
 
     # Remove HTML comments
-    body = re.sub(r"<!--.*?-->", "", body, flags=re.DOTALL)
+    body = _HTML_COMMENT.sub("", body)
 
     # Fix relative links to be absolute GitHub links
     # This handles [text](../path) or [text](/path) patterns
     repo_base = "https://github.com/saezlab/corneto"
-    body = re.sub(r"\[([^\]]+)\]\(\.\.\/([^)]+)\)", rf"[\1]({repo_base}/\2)", body)
-    body = re.sub(r"\[([^\]]+)\]\(\/([^)]+)\)", rf"[\1]({repo_base}/\2)", body)
-
-    # Ensure proper spacing around headers
-    body = re.sub(r"\n(#{1,6}\s)", r"\n\n\1", body)
-    body = re.sub(r"^(#{1,6}\s)", r"\1", body)  # Don't add space at start
+    body = _REL_LINK.sub(lambda m: f"[{m.group(1)}]({repo_base}/{m.group(3)})", body)
+
+    # Ensure proper spacing around headers (never at the start of the body):
+    # single linear pass instead of a backtracking regex scan
+    out = []
+    prev_blank = True
+    for line in body.split("\n"):
+        if _is_markdown_header(line) and not prev_blank and out:
+            out.append("")
+        out.append(line)
+        prev_blank = not line.strip()
+    body = "\n".join(out)
 
     return body.strip()
 
 
-def format_release_date(published_at: str) -> str:
-    """Format release date for display."""
-    try:
-        dt = datetime.fromisoformat(published_at.replace("Z", "+00:00"))
-        return dt.strftime("%B %d, %Y")
-    except (ValueError, AttributeError):
-        return published_at
+def format_release_date(dt: datetime) -> str:
+    """Format a release datetime for display."""
+    return dt.strftime("%B %d, %Y")
 
 
 def generate_release_markdown(release: Dict) -> str:
     """Generate Sphinx-compatible markdown for a release."""
     tag_name = release["tag_name"]
     name = release["name"] or tag_name
-    published_at = format_release_date(release["published_at"])
+    published_at = format_release_date(release["_dt"])
     body = clean_release_body(release["body"])
     html_url = release["html_url"]
 
@@ -110,8 +204,8 @@ pip install corneto=={tag_name.lstrip("v")}
 
 def update_releases_index(releases: List[Dict], releases_dir: Path) -> None:
     """Update the releases index.md file."""
-    # Sort releases by version (newest first)
-    sorted_releases = sorted(releases, key=lambda x: x["published_at"], reverse=True)
+    # Sort releases by publication date (newest first)
+    sorted_releases = sorted(releases, key=lambda x: x["_dt"], reverse=True)
 
     content = """# Release Notes
 
@@ -153,10 +247,8 @@ For information on contributing to CORNETO and the release process, see our [con
 """
 
     index_file = releases_dir / "index.md"
-    with open(index_file, "w", encoding="utf-8") as f:
-        f.write(content)
-
-    print(f"Updated {index_file}")
+    if _write_if_changed(index_file, content):
+        print(f"Updated {index_file}")
 
 
 def sync_releases_to_docs(repo: str, docs_dir: str = "docs", token: Optional[str] = None) -> None:
@@ -171,6 +263,10 @@ def sync_releases_to_docs(repo: str, docs_dir: str = "docs", token: Optional[str
 
     print(f"Found {len(releases)} releases")
 
+    # Parse publication dates once; sorting and formatting reuse them
+    for release in releases:
+        release["_dt"] = datetime.fromisoformat(release["published_at"].replace("Z", "+00:00"))
+
     # Setup directories
     docs_path = Path(docs_dir)
     releases_dir = docs_path / "releases"
@@ -183,10 +279,8 @@ def sync_releases_to_docs(repo: str, docs_dir: str = "docs", token: Optional[str
 
         content = generate_release_markdown(release)
 
-        with open(release_file, "w", encoding="utf-8") as f:
-            f.write(content)
-
-        print(f"Generated {release_file}")
+        if _write_if_changed(release_file, content):
+            print(f"Generated {release_file}")
 
     # Update the index file
     update_releases_index(releases, releases_dir)
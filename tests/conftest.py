@@ -30,7 +30,7 @@ def pytest_addoption(parser):
     parser.addoption("--run-optional", action="store_true", default=False, help="Run optional tests")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def solver(request):
     """Fixture that provides the solver specified in command line.
 
@@ -40,12 +40,14 @@ def solver(request):
     return request.config.getoption("--solver")
 
 
-@pytest.fixture(params=["cvxpy", "picos"])
+@pytest.fixture(scope="session", params=["cvxpy", "picos"])
 def backend(request, solver):
     """Fixture that provides optimization backend instances for testing.
 
     Parameterized to test both cvxpy and picos backends unless a specific
-    backend is requested via --backend option.
+    backend is requested via --backend option. Session-scoped so backend
+    construction and solver discovery happen once per worker; tests must
+    not mutate the returned instance (e.g. ``_default_solver``).
 
     Args:
         request: pytest request object
@@ -4,7 +4,7 @@ from corneto.backend import Backend, CvxpyBackend, PicosBackend
 from corneto.methods import runVanillaCarnival
 
 
-@pytest.fixture(params=[CvxpyBackend])
+@pytest.fixture(scope="session", params=[CvxpyBackend])
 def backend(request):
     opt: Backend = request.param()
     if isinstance(opt, CvxpyBackend):
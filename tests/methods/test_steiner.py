@@ -7,8 +7,9 @@ from corneto._graph import BaseGraph
 from corneto.methods.steiner import exact_steiner_tree
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def steiner_graph() -> BaseGraph:
+    """Load the reference Steiner graph once per module (read-only in tests)."""
     file = pathlib.Path(__file__).parent.joinpath("test_steiner_graph.pkl.gz")
     return BaseGraph.load(str(file))
 